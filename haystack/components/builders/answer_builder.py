@@ -56,6 +56,8 @@ class AnswerBuilder:
 
         self.pattern = pattern
         self.reference_pattern = reference_pattern
+        self._compiled_pattern = re.compile(pattern) if pattern else None
+        self._compiled_reference_pattern = re.compile(reference_pattern) if reference_pattern else None
 
     @component.output_types(answers=List[GeneratedAnswer])
     def run(  # pylint: disable=too-many-positional-arguments
@@ -108,8 +110,11 @@ class AnswerBuilder:
         if pattern:
             AnswerBuilder._check_num_groups_in_regex(pattern)
 
-        pattern = pattern or self.pattern
-        reference_pattern = reference_pattern or self.reference_pattern
+        # Compile the patterns once per call instead of once per reply
+        compiled_pattern = re.compile(pattern) if pattern else self._compiled_pattern
+        compiled_reference_pattern = (
+            re.compile(reference_pattern) if reference_pattern else self._compiled_reference_pattern
+        )
         all_answers = []
         for reply, given_metadata in zip(replies, meta):
             # Extract content from ChatMessage objects if reply is a ChatMessages, else use the string as is
@@ -125,8 +130,8 @@ class AnswerBuilder:
 
             referenced_docs = []
             if documents:
-                if reference_pattern:
-                    reference_idxs = AnswerBuilder._extract_reference_idxs(extracted_reply, reference_pattern)
+                if compiled_reference_pattern:
+                    reference_idxs = AnswerBuilder._extract_reference_idxs(extracted_reply, compiled_reference_pattern)
                 else:
                     reference_idxs = [doc_idx for doc_idx, _ in enumerate(documents)]
 
@@ -138,7 +143,7 @@ class AnswerBuilder:
                             "Document index '{index}' referenced in Generator output is out of range. ", index=idx + 1
                         )
 
-            answer_string = AnswerBuilder._extract_answer_string(extracted_reply, pattern)
+            answer_string = AnswerBuilder._extract_answer_string(extracted_reply, compiled_pattern)
             answer = GeneratedAnswer(
                 data=answer_string, query=query, documents=referenced_docs, meta=extracted_metadata
             )
@@ -147,7 +152,7 @@ class AnswerBuilder:
         return {"answers": all_answers}
 
     @staticmethod
-    def _extract_answer_string(reply: str, pattern: Optional[str] = None) -> str:
+    def _extract_answer_string(reply: str, pattern: Optional[re.Pattern] = None) -> str:
         """
         Extract the answer string from the generator output using the specified pattern.
 
@@ -156,12 +161,12 @@ class AnswerBuilder:
         :param reply:
             The output of the Generator. A string.
         :param pattern:
-            The regular expression pattern to use to extract the answer text from the generator output.
+            The compiled regular expression pattern to use to extract the answer text from the generator output.
         """
         if pattern is None:
             return reply
 
-        if match := re.search(pattern, reply):
+        if match := pattern.search(reply):
             # No capture group in pattern -> use the whole match as answer
             if not match.lastindex:
                 return match.group(0)
@@ -170,8 +175,8 @@ class AnswerBuilder:
         return ""
 
     @staticmethod
-    def _extract_reference_idxs(reply: str, reference_pattern: str) -> List[int]:
-        document_idxs = re.findall(reference_pattern, reply)
+    def _extract_reference_idxs(reply: str, reference_pattern: re.Pattern) -> List[int]:
+        document_idxs = reference_pattern.findall(reply)
         return [int(idx) - 1 for idx in document_idxs]
 
     @staticmethod
@@ -2,8 +2,11 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from statistics import mean
-from typing import Any, Dict, List, Optional
+from copy import deepcopy
+from typing import Any, Dict, List, Optional, Tuple
+from warnings import warn
+
+from numpy import mean as np_mean
 
 from haystack import component, default_from_dict, default_to_dict
 from haystack.components.evaluators.llm_evaluator import LLMEvaluator
@@ -174,20 +177,47 @@ class ContextRelevanceEvaluator(LLMEvaluator):
                 - `score`: Mean context relevance score over all the provided input questions.
                 - `results`: A list of dictionaries with `relevant_statements` and `score` for each input context.
         """
-        result = super(ContextRelevanceEvaluator, self).run(**inputs)
-
-        for idx, res in enumerate(result["results"]):
+        self.validate_input_parameters(dict(self.inputs), inputs)
+
+        # Only send each distinct (question, contexts) pair to the LLM once
+        keys = [(question, tuple(contexts)) for question, contexts in zip(inputs["questions"], inputs["contexts"])]
+        unique_idxs: Dict[Tuple[str, Tuple[str, ...]], int] = {}
+        for key in keys:
+            unique_idxs.setdefault(key, len(unique_idxs))
+
+        unique_questions = [question for question, _ in unique_idxs]
+        unique_contexts = [list(contexts) for _, contexts in unique_idxs]
+        # the inputs are already validated, so the LLM is called directly instead of going through LLMEvaluator.run
+        unique_results, metadata = self._evaluate_inputs({"questions": unique_questions, "contexts": unique_contexts})
+
+        # failures are counted over the original inputs, the same way LLMEvaluator.run does
+        errors = sum(1 for key in keys if unique_results[unique_idxs[key]] is None)
+        if errors > 0:
+            msg = f"LLM evaluator failed for {errors} out of {len(keys)} inputs."
+            warn(msg)
+
+        scored_results: List[Dict[str, Any]] = []
+        for res in unique_results:
             if res is None:
-                result["results"][idx] = {"relevant_statements": [], "score": float("nan")}
-                continue
-            if len(res["relevant_statements"]) > 0:
-                res["score"] = 1
+                scored_results.append({"relevant_statements": [], "score": float("nan")})
             else:
-                res["score"] = 0
+                res["score"] = 1 if len(res["relevant_statements"]) > 0 else 0
+                scored_results.append(res)
+
+        # Scatter the results back to the original input order, copying the ones of duplicated pairs
+        results = []
+        seen = set()
+        for key in keys:
+            idx = unique_idxs[key]
+            results.append(deepcopy(scored_results[idx]) if idx in seen else scored_results[idx])
+            seen.add(idx)
+        result: Dict[str, Any] = {"results": results, "meta": metadata}
 
         # calculate average context relevance score over all queries
-        result["score"] = mean([res["score"] for res in result["results"]])
-        result["individual_scores"] = [res["score"] for res in result["results"]]  # useful for the EvaluationRunResult
+        # a NaN score (failed evaluation) propagates to the mean
+        individual_scores = [res["score"] for res in results]
+        result["score"] = float(np_mean(individual_scores)) if individual_scores else float("nan")
+        result["individual_scores"] = individual_scores  # useful for the EvaluationRunResult
 
         return result
 
@@ -193,6 +193,25 @@ class LLMEvaluator:
         """
         self.validate_input_parameters(dict(self.inputs), inputs)
 
+        results, metadata = self._evaluate_inputs(inputs)
+        errors = sum(1 for result in results if result is None)
+        if errors > 0:
+            msg = f"LLM evaluator failed for {errors} out of {len(results)} inputs."
+            warn(msg)
+
+        return {"results": results, "meta": metadata}
+
+    def _evaluate_inputs(
+        self, inputs: Dict[str, List[Any]]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], Optional[Dict[str, Any]]]:
+        """
+        Sends the already validated inputs to the LLM and parses its replies.
+
+        :param inputs:
+            The input values to evaluate. The keys are the input names and the values are lists of input values.
+        :returns:
+            The parsed result of each input, `None` for the ones that failed, and the metadata of the last reply.
+        """
         # inputs is a dictionary with keys being input names and values being a list of input values
         # We need to iterate through the lists in parallel for all keys of the dictionary
         input_names, values = inputs.keys(), list(zip(*inputs.values()))
@@ -200,7 +219,6 @@ class LLMEvaluator:
 
         results: List[Optional[Dict[str, Any]]] = []
         metadata = None
-        errors = 0
         for input_names_to_values in tqdm(list_of_input_names_to_values, disable=not self.progress_bar):
             prompt = self.builder.run(**input_names_to_values)
             try:
@@ -211,7 +229,6 @@ class LLMEvaluator:
                     raise ValueError(msg)
                 warn(msg)
                 results.append(None)
-                errors += 1
                 continue
 
             if self.is_valid_json_and_has_expected_keys(expected=self.outputs, received=result["replies"][0]):
@@ -219,16 +236,11 @@ class LLMEvaluator:
                 results.append(parsed_result)
             else:
                 results.append(None)
-                errors += 1
 
             if self.api == "openai" and "meta" in result:
                 metadata = result["meta"]
 
-        if errors > 0:
-            msg = f"LLM evaluator failed for {errors} out of {len(list_of_input_names_to_values)} inputs."
-            warn(msg)
-
-        return {"results": results, "meta": metadata}
+        return results, metadata
 
     def prepare_template(self) -> str:
         """
@@ -95,7 +95,7 @@ class DALLEImageGenerator:
         prompt: str,
         size: Optional[Literal["256x256", "512x512", "1024x1024", "1792x1024", "1024x1792"]] = None,
         quality: Optional[Literal["standard", "hd"]] = None,
-        response_format: Optional[Optional[Literal["url", "b64_json"]]] = None,
+        response_format: Optional[Literal["url", "b64_json"]] = None,
     ):
         """
         Invokes the image generation inference based on the provided prompt and generation parameters.
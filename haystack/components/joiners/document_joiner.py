@@ -167,14 +167,13 @@ class DocumentJoiner:
         """
         Concatenate multiple lists of Documents and return only the Document with the highest score for duplicates.
         """
-        output = []
-        docs_per_id = defaultdict(list)
+        # Keep a single Document per ID while iterating, the first one wins in case of equal scores
+        best_docs: Dict[str, Document] = {}
         for doc in itertools.chain.from_iterable(document_lists):
-            docs_per_id[doc.id].append(doc)
-        for docs in docs_per_id.values():
-            doc_with_best_score = max(docs, key=lambda doc: doc.score if doc.score else -inf)
-            output.append(doc_with_best_score)
-        return output
+            best_doc = best_docs.get(doc.id)
+            if best_doc is None or (doc.score if doc.score else -inf) > (best_doc.score if best_doc.score else -inf):
+                best_docs[doc.id] = doc
+        return list(best_docs.values())
 
     def _merge(self, document_lists: List[List[Document]]) -> List[Document]:
         """
@@ -155,7 +155,8 @@ class InMemoryEmbeddingRetriever:
         Run the InMemoryEmbeddingRetriever on the given input data.
 
         :param query_embedding:
-            Embedding of the query.
+            Embedding of the query. A 1D NumPy array of floats is also accepted and used without copying it
+            into a list.
         :param filters:
             A dictionary with filters to narrow down the search space when retrieving documents.
         :param top_k:
@@ -2,14 +2,27 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from typing import Any, Dict, List, Optional
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
 
 from haystack import component, default_from_dict, default_to_dict, logging
 from haystack.lazy_imports import LazyImport
-from haystack.utils import ComponentDevice, Secret, deserialize_secrets_inplace
+from haystack.utils import (
+    ComponentDevice,
+    Secret,
+    deserialize_callable,
+    deserialize_secrets_inplace,
+    serialize_callable,
+)
 
 logger = logging.getLogger(__name__)
 
+# Default maximum number of texts for which the predicted label is kept in memory
+PREDICTION_CACHE_SIZE = 1024
+
 
 with LazyImport(message="Run 'pip install transformers[torch,sentencepiece]'") as torch_and_transformers_import:
     from transformers import pipeline
@@ -21,6 +34,54 @@ with LazyImport(message="Run 'pip install transformers[torch,sentencepiece]'") a
     )
 
 
+class _ZeroShotPipelineFactory:
+    """
+    Factory class to create Hugging Face zero-shot classification pipelines, shared by routers with the same kwargs.
+
+    Shared pipelines are kept in memory until the end of the process.
+    """
+
+    _instances: Dict[str, Any] = {}
+
+    @staticmethod
+    def get_pipeline(huggingface_pipeline_kwargs: Dict[str, Any]) -> Any:
+        pipeline_id = _ZeroShotPipelineFactory._get_pipeline_id(huggingface_pipeline_kwargs)
+        if pipeline_id is None:
+            # kwargs that can't be serialized, like a model object, can't be compared reliably so they aren't shared
+            return pipeline(**huggingface_pipeline_kwargs)
+
+        if pipeline_id in _ZeroShotPipelineFactory._instances:
+            return _ZeroShotPipelineFactory._instances[pipeline_id]
+        hf_pipeline = pipeline(**huggingface_pipeline_kwargs)
+        _ZeroShotPipelineFactory._instances[pipeline_id] = hf_pipeline
+        return hf_pipeline
+
+    @staticmethod
+    def _get_pipeline_id(huggingface_pipeline_kwargs: Dict[str, Any]) -> Optional[str]:
+        """
+        Serializes the pipeline kwargs the same way `to_dict` does, to identify pipelines created with the same kwargs.
+
+        :param huggingface_pipeline_kwargs: The kwargs used to create the pipeline.
+        :returns: A JSON string of the kwargs, or `None` if they can't be serialized.
+        """
+        try:
+            return json.dumps(huggingface_pipeline_kwargs, sort_keys=True)
+        except TypeError:
+            pass
+
+        # values like torch dtypes are converted by serialize_hf_model_kwargs, which works in place
+        serialized_kwargs = _copy_nested_dicts(huggingface_pipeline_kwargs)
+        serialize_hf_model_kwargs(serialized_kwargs)
+        try:
+            return json.dumps(serialized_kwargs, sort_keys=True)
+        except TypeError:
+            return None
+
+
+def _copy_nested_dicts(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: _copy_nested_dicts(value) if isinstance(value, dict) else value for key, value in kwargs.items()}
+
+
 @component
 class TransformersZeroShotTextRouter:
     """
@@ -103,6 +164,8 @@ class TransformersZeroShotTextRouter:
         device: Optional[ComponentDevice] = None,
         token: Optional[Secret] = Secret.from_env_var(["HF_API_TOKEN", "HF_TOKEN"], strict=False),
         huggingface_pipeline_kwargs: Optional[Dict[str, Any]] = None,
+        fast_path: Optional[Callable[[str], Optional[str]]] = None,
+        prediction_cache_size: int = PREDICTION_CACHE_SIZE,
     ):
         """
         Initializes the TransformersZeroShotTextRouter component.
@@ -122,12 +185,26 @@ class TransformersZeroShotTextRouter:
             To generate these tokens, run `transformers-cli login`.
         :param huggingface_pipeline_kwargs: A dictionary of keyword arguments for initializing the Hugging Face
             zero shot text classification.
+            For example, pass `{"torch_dtype": torch.float16}` to run the model in half precision on a GPU,
+            which roughly halves its memory usage and speeds up inference.
+        :param fast_path: An optional function that takes the text and returns one of the labels, or `None` if it
+            can't decide. When it returns a label, the text is routed without running the model.
+            Use it for texts that a cheap heuristic classifies reliably.
+            To keep the component serializable, pass a function defined at module level, not a lambda:
+            ```python
+            def short_text_fast_path(text: str) -> Optional[str]:
+                return "query" if len(text.split()) <= 4 else None
+            ```
+        :param prediction_cache_size: The maximum number of texts for which the predicted label is kept in memory,
+            so that routing the same text again doesn't run the model. Set it to `0` to disable the cache.
         """
         torch_and_transformers_import.check()
 
         self.token = token
         self.labels = labels
         self.multi_label = multi_label
+        self.fast_path = fast_path
+        self.prediction_cache_size = prediction_cache_size
         component.set_output_types(self, **{label: str for label in labels})
 
         huggingface_pipeline_kwargs = resolve_hf_pipeline_kwargs(
@@ -140,6 +217,9 @@ class TransformersZeroShotTextRouter:
         )
         self.huggingface_pipeline_kwargs = huggingface_pipeline_kwargs
         self.pipeline = None
+        # zero-shot predictions are deterministic for a given model and set of labels,
+        # so recently routed texts don't need to go through the model again
+        self._prediction_cache: "OrderedDict[Tuple[str, Tuple[str, ...], bool], str]" = OrderedDict()
 
     def _get_telemetry_data(self) -> Dict[str, Any]:
         """
@@ -154,7 +234,7 @@ class TransformersZeroShotTextRouter:
         Initializes the component.
         """
         if self.pipeline is None:
-            self.pipeline = pipeline(**self.huggingface_pipeline_kwargs)
+            self.pipeline = _ZeroShotPipelineFactory.get_pipeline(self.huggingface_pipeline_kwargs)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -168,6 +248,8 @@ class TransformersZeroShotTextRouter:
             labels=self.labels,
             huggingface_pipeline_kwargs=self.huggingface_pipeline_kwargs,
             token=self.token.to_dict() if self.token else None,
+            fast_path=serialize_callable(self.fast_path) if self.fast_path else None,
+            prediction_cache_size=self.prediction_cache_size,
         )
 
         huggingface_pipeline_kwargs = serialization_dict["init_parameters"]["huggingface_pipeline_kwargs"]
@@ -189,6 +271,8 @@ class TransformersZeroShotTextRouter:
         deserialize_secrets_inplace(data["init_parameters"], keys=["token"])
         if data["init_parameters"].get("huggingface_pipeline_kwargs") is not None:
             deserialize_hf_model_kwargs(data["init_parameters"]["huggingface_pipeline_kwargs"])
+        if data["init_parameters"].get("fast_path") is not None:
+            data["init_parameters"]["fast_path"] = deserialize_callable(data["init_parameters"]["fast_path"])
         return default_from_dict(cls, data)
 
     def run(self, text: str) -> Dict[str, str]:
@@ -212,8 +296,27 @@ class TransformersZeroShotTextRouter:
         if not isinstance(text, str):
             raise TypeError("TransformersZeroShotTextRouter expects a str as input.")
 
+        if self.fast_path is not None:
+            label = self.fast_path(text)
+            if label in self.labels:
+                return {label: text}
+
+        # labels and multi_label are part of the key, in case they are changed after initialization
+        cache_key = (text, tuple(self.labels), self.multi_label)
+        if self.prediction_cache_size > 0:
+            # popped and inserted again to mark it as the most recently used, without failing if another
+            # thread evicted it in the meantime
+            label = self._prediction_cache.pop(cache_key, None)
+            if label is not None:
+                self._prediction_cache[cache_key] = label
+                return {label: text}
+
         prediction = self.pipeline(sequences=[text], candidate_labels=self.labels, multi_label=self.multi_label)
-        predicted_scores = prediction[0]["scores"]
-        max_score_index = max(range(len(predicted_scores)), key=predicted_scores.__getitem__)
+        max_score_index = int(np.argmax(prediction[0]["scores"]))
         label = prediction[0]["labels"][max_score_index]
+
+        if self.prediction_cache_size > 0:
+            self._prediction_cache[cache_key] = label
+            while len(self._prediction_cache) > self.prediction_cache_size:
+                self._prediction_cache.popitem(last=False)
         return {label: text}
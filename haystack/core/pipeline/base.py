@@ -8,7 +8,7 @@ from collections import defaultdict
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Optional, Set, TextIO, Tuple, Type, TypeVar, Union
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, TextIO, Tuple, Type, TypeVar, Union
 
 import networkx  # type:ignore
 
@@ -67,6 +67,11 @@ class PipelineBase:
         self.metadata = metadata or {}
         self.graph = networkx.MultiDiGraph()
         self._max_runs_per_component = max_runs_per_component
+        # Input and output specs of each Component, used as tracing tags. Built on first run.
+        self._component_specs: Dict[str, Tuple[Dict[str, Any], Dict[str, Any]]] = {}
+        # Order in which Components are first queued to run and the cycles they're part of.
+        # Built on first run and reset whenever the graph changes.
+        self._run_order: Optional[Tuple[List[Tuple[str, Component]], Dict[str, List[List[str]]]]] = None
 
     def __eq__(self, other) -> bool:
         """
@@ -318,13 +323,16 @@ class PipelineBase:
         # Add component to the graph, disconnected
         logger.debug("Adding component '{component_name}' ({component})", component_name=name, component=instance)
         # We're completely sure the fields exist so we ignore the type error
+        input_sockets = instance.__haystack_input__._sockets_dict  # type: ignore[attr-defined]
         self.graph.add_node(
             name,
             instance=instance,
-            input_sockets=instance.__haystack_input__._sockets_dict,  # type: ignore[attr-defined]
+            input_sockets=input_sockets,
             output_sockets=instance.__haystack_output__._sockets_dict,  # type: ignore[attr-defined]
+            variadic_input_sockets=tuple(socket.name for socket in input_sockets.values() if socket.is_variadic),
             visits=0,
         )
+        self._run_order = None
 
     def remove_component(self, name: str) -> Component:
         """
@@ -353,6 +361,8 @@ class PipelineBase:
 
         # Delete component from the graph, deleting all its connections
         self.graph.remove_node(name)
+        self._component_specs.clear()
+        self._run_order = None
 
         # Reset the Component sockets' senders and receivers
         input_sockets = instance.__haystack_input__._sockets_dict  # type: ignore[attr-defined]
@@ -527,6 +537,9 @@ class PipelineBase:
         # Update the sockets with the new connection
         sender_socket.receivers.append(receiver_component_name)
         receiver_socket.senders.append(sender_component_name)
+        self._component_specs.pop(sender_component_name, None)
+        self._component_specs.pop(receiver_component_name, None)
+        self._run_order = None
 
         # Create the new connection
         self.graph.add_edge(
@@ -818,6 +831,36 @@ class PipelineBase:
         for node in self.graph.nodes:
             self.graph.nodes[node]["visits"] = 0
 
+    def _get_component_specs(self, name: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Returns the input and output specs of a Component, building them the first time they're needed.
+
+        :param name:
+            Name of the Component as defined in the Pipeline.
+        :returns:
+            A tuple with the input spec and the output spec, mapping each socket name to its type and connections.
+        """
+        specs = self._component_specs.get(name)
+        if specs is None:
+            instance: Component = self.graph.nodes[name]["instance"]
+            input_spec = {
+                key: {
+                    "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
+                    "senders": value.senders,
+                }
+                for key, value in instance.__haystack_input__._sockets_dict.items()  # type: ignore
+            }
+            output_spec = {
+                key: {
+                    "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
+                    "receivers": value.receivers,
+                }
+                for key, value in instance.__haystack_output__._sockets_dict.items()  # type: ignore
+            }
+            specs = (input_spec, output_spec)
+            self._component_specs[name] = specs
+        return specs
+
     def _find_receivers_from(self, component_name: str) -> List[Tuple[str, OutputSocket, InputSocket]]:
         """
         Utility function to find all Components that receive input form `component_name`.
@@ -841,7 +884,7 @@ class PipelineBase:
         receiver_components: List[Tuple[str, OutputSocket, InputSocket]],
         component_result: Dict[str, Any],
         components_inputs: Dict[str, Dict[str, Any]],
-        run_queue: List[Tuple[str, Component]],
+        run_queue: Deque[Tuple[str, Component]],
         waiting_queue: List[Tuple[str, Component]],
     ) -> Dict[str, Any]:
         """
@@ -1158,6 +1201,28 @@ class PipelineBase:
         current_inputs = inputs[name].keys()
         return expected_inputs == current_inputs
 
+    def _get_run_order(self) -> Tuple[List[Tuple[str, Component]], Dict[str, List[List[str]]]]:
+        """
+        Returns the order in which the Components are first queued to run and the cycles they're part of.
+
+        Both only depend on the Pipeline's graph, so they're computed once and reused by following runs
+        until a Component is added, removed or connected.
+
+        :returns:
+            A tuple containing:
+                * A list of Component's names and instances in topological order of the graph without cycles
+                * A dictionary of Component's names and a list of all the cycles they were part of
+        :raises PipelineRuntimeError:
+            If the Pipeline contains cycles that can't be broken.
+        """
+        if self._run_order is None:
+            graph_without_cycles, components_in_cycles = self._break_supported_cycles_in_graph()
+            run_order = [
+                (node, self.graph.nodes[node]["instance"]) for node in networkx.topological_sort(graph_without_cycles)
+            ]
+            self._run_order = (run_order, components_in_cycles)
+        return self._run_order
+
     def _break_supported_cycles_in_graph(self) -> Tuple[networkx.MultiDiGraph, Dict[str, List[List[str]]]]:
         """
         Utility function to remove supported cycles in the Pipeline's graph.
@@ -1313,9 +1378,28 @@ def _add_missing_input_defaults(name: str, comp: Component, components_inputs: D
             components_inputs[name][input_socket.name] = input_socket.default_value
 
 
+def _copy_outputs_sent_to_receivers(comp: Component, outputs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copies the outputs of a Component so that the Components receiving them can't modify the copy.
+
+    Only the outputs of sockets connected to other Components are deep copied, the others are never handed
+    to another Component so they're kept as they are.
+
+    :param comp: Instance of the Component
+    :param outputs: The output of the Component
+    :returns: A new dictionary with the output of the Component
+    """
+    output_sockets = comp.__haystack_output__._sockets_dict  # type: ignore
+    copied_outputs = {}
+    for socket_name, value in outputs.items():
+        socket = output_sockets.get(socket_name)
+        copied_outputs[socket_name] = deepcopy(value) if socket is not None and socket.receivers else value
+    return copied_outputs
+
+
 def _enqueue_component(
     component_pair: Tuple[str, Component],
-    run_queue: List[Tuple[str, Component]],
+    run_queue: Deque[Tuple[str, Component]],
     waiting_queue: List[Tuple[str, Component]],
 ):
     """
@@ -1336,7 +1420,7 @@ def _enqueue_component(
 
 def _dequeue_component(
     component_pair: Tuple[str, Component],
-    run_queue: List[Tuple[str, Component]],
+    run_queue: Deque[Tuple[str, Component]],
     waiting_queue: List[Tuple[str, Component]],
 ):
     """
@@ -2,16 +2,16 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+from collections import deque
 from copy import deepcopy
-from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+from typing import Any, Deque, Dict, List, Mapping, Optional, Set, Tuple
 from warnings import warn
 
-import networkx as nx
-
 from haystack import logging, tracing
 from haystack.core.component import Component
 from haystack.core.errors import PipelineMaxComponentRuns, PipelineRuntimeError
 from haystack.core.pipeline.base import (
+    _copy_outputs_sent_to_receivers,
     _dequeue_component,
     _dequeue_waiting_component,
     _enqueue_component,
@@ -46,53 +46,58 @@ class Pipeline(PipelineBase):
         """
         instance: Component = self.graph.nodes[name]["instance"]
 
+        if not tracing.is_tracing_enabled():
+            # Spans would be discarded anyway, skip building their tags and copying the inputs
+            return self._run_component_instance(name, instance, inputs)
+
+        input_spec, output_spec = self._get_component_specs(name)
+
         with tracing.tracer.trace(
             "haystack.component.run",
             tags={
                 "haystack.component.name": name,
                 "haystack.component.type": instance.__class__.__name__,
                 "haystack.component.input_types": {k: type(v).__name__ for k, v in inputs.items()},
-                "haystack.component.input_spec": {
-                    key: {
-                        "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
-                        "senders": value.senders,
-                    }
-                    for key, value in instance.__haystack_input__._sockets_dict.items()  # type: ignore
-                },
-                "haystack.component.output_spec": {
-                    key: {
-                        "type": (value.type.__name__ if isinstance(value.type, type) else str(value.type)),
-                        "receivers": value.receivers,
-                    }
-                    for key, value in instance.__haystack_output__._sockets_dict.items()  # type: ignore
-                },
+                "haystack.component.input_spec": input_spec,
+                "haystack.component.output_spec": output_spec,
             },
             parent_span=parent_span,
         ) as span:
             # We deepcopy the inputs otherwise we might lose that information
             # when we delete them in case they're sent to other Components
             span.set_content_tag("haystack.component.input", deepcopy(inputs))
-            logger.info("Running component {component_name}", component_name=name)
-            res: Dict[str, Any] = instance.run(**inputs)
-            self.graph.nodes[name]["visits"] += 1
-
-            # After a Component that has variadic inputs is run, we need to reset the variadic inputs that were consumed
-            for socket in instance.__haystack_input__._sockets_dict.values():  # type: ignore
-                if socket.name not in inputs:
-                    continue
-                if socket.is_variadic:
-                    inputs[socket.name] = []
-
-            if not isinstance(res, Mapping):
-                raise PipelineRuntimeError(
-                    f"Component '{name}' didn't return a dictionary. "
-                    "Components must always return dictionaries: check the documentation."
-                )
+            res = self._run_component_instance(name, instance, inputs)
             span.set_tag("haystack.component.visits", self.graph.nodes[name]["visits"])
             span.set_content_tag("haystack.component.output", res)
 
             return res
 
+    def _run_component_instance(self, name: str, instance: Component, inputs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Runs a Component instance and updates the Pipeline's state after it ran.
+
+        :param name: Name of the Component as defined in the Pipeline.
+        :param instance: The Component instance to run.
+        :param inputs: Inputs for the Component.
+        :raises PipelineRuntimeError: If Component doesn't return a dictionary.
+        :return: The output of the Component.
+        """
+        logger.info("Running component {component_name}", component_name=name)
+        res: Dict[str, Any] = instance.run(**inputs)
+        self.graph.nodes[name]["visits"] += 1
+
+        # After a Component that has variadic inputs is run, we need to reset the variadic inputs that were consumed
+        for socket_name in self.graph.nodes[name]["variadic_input_sockets"]:
+            if socket_name in inputs:
+                inputs[socket_name] = []
+
+        if not isinstance(res, Mapping):
+            raise PipelineRuntimeError(
+                f"Component '{name}' didn't return a dictionary. "
+                "Components must always return dictionaries: check the documentation."
+            )
+        return res
+
     def _run_subgraph(  # noqa: PLR0915
         self,
         cycle: List[str],
@@ -127,7 +132,7 @@ class Pipeline(PipelineBase):
             If a Component reaches the maximum number of times it can be run in this Pipeline
         """
         waiting_queue: List[Tuple[str, Component]] = []
-        run_queue: List[Tuple[str, Component]] = []
+        run_queue: Deque[Tuple[str, Component]] = deque()
 
         # Create the run queue starting with the component that needs to run first
         start_index = cycle.index(component_name)
@@ -136,6 +141,9 @@ class Pipeline(PipelineBase):
 
         include_outputs_from = set() if include_outputs_from is None else include_outputs_from
 
+        # Used for membership checks, the order of the Components is only needed to build the run queue
+        cycle_components = frozenset(cycle)
+
         before_last_waiting_queue: Optional[Set[str]] = None
         last_waiting_queue: Optional[Set[str]] = None
 
@@ -151,7 +159,7 @@ class Pipeline(PipelineBase):
 
         while not cycle_received_inputs:
             # Here we run the Components
-            name, comp = run_queue.pop(0)
+            name, comp = run_queue.popleft()
             if _is_lazy_variadic(comp) and not all(_is_lazy_variadic(comp) for _, comp in run_queue):
                 # We run Components with lazy variadic inputs only if there only Components with
                 # lazy variadic inputs left to run
@@ -168,38 +176,35 @@ class Pipeline(PipelineBase):
 
                 # Delete the inputs that were consumed by the Component and are not received from
                 # the user or from Components that are part of this cycle
+                input_sockets = self.graph.nodes[name]["input_sockets"]
                 sockets = list(components_inputs[name].keys())
                 for socket_name in sockets:
-                    senders = comp.__haystack_input__._sockets_dict[socket_name].senders  # type: ignore
+                    senders = input_sockets[socket_name].senders
                     if not senders:
                         # We keep inputs that came from the user
                         continue
-                    all_senders_in_cycle = all(sender in cycle for sender in senders)
+                    all_senders_in_cycle = all(sender in cycle_components for sender in senders)
                     if all_senders_in_cycle:
                         # All senders are in the cycle, we can remove the input.
                         # We'll receive it later at a certain point.
                         del components_inputs[name][socket_name]
 
                 if name in include_outputs_from:
-                    # Deepcopy the outputs to prevent downstream nodes from modifying them
+                    # Deepcopy the outputs sent to other Components to prevent downstream nodes from modifying them
                     # We don't care about loops - Always store the last output.
-                    extra_outputs[name] = deepcopy(res)
+                    extra_outputs[name] = _copy_outputs_sent_to_receivers(comp, res)
 
                 # Reset the waiting for input previous states, we managed to run a component
                 before_last_waiting_queue = None
                 last_waiting_queue = None
 
                 # Check if a component doesn't send any output to components that are part of the cycle
-                final_output_reached = False
-                for output_socket in res.keys():
-                    for receiver in comp.__haystack_output__._sockets_dict[output_socket].receivers:  # type: ignore
-                        if receiver in cycle:
-                            final_output_reached = True
-                            break
-                    if final_output_reached:
-                        break
+                output_sockets = self.graph.nodes[name]["output_sockets"]
+                sends_output_to_cycle = any(
+                    not cycle_components.isdisjoint(output_sockets[output_socket].receivers) for output_socket in res
+                )
 
-                if not final_output_reached:
+                if not sends_output_to_cycle:
                     # We stop only if the Component we just ran doesn't send any output to sockets that
                     # are part of the cycle
                     cycle_received_inputs = True
@@ -210,7 +215,7 @@ class Pipeline(PipelineBase):
                 for pair in self._find_components_that_will_receive_no_input(name, res, components_inputs):
                     _dequeue_component(pair, run_queue, waiting_queue)
 
-                receivers = [item for item in self._find_receivers_from(name) if item[0] in cycle]
+                receivers = [item for item in self._find_receivers_from(name) if item[0] in cycle_components]
 
                 res = self._distribute_output(receivers, res, components_inputs, run_queue, waiting_queue)
 
@@ -248,7 +253,8 @@ class Pipeline(PipelineBase):
                     _enqueue_component((name, comp), run_queue, waiting_queue)
                     continue
 
-                before_last_waiting_queue = last_waiting_queue.copy() if last_waiting_queue is not None else None
+                # The previous snapshot is never modified, a new set is built for each one
+                before_last_waiting_queue = last_waiting_queue
                 last_waiting_queue = {item[0] for item in waiting_queue}
 
                 (name, comp) = self._find_next_runnable_component(components_inputs, waiting_queue)
@@ -388,11 +394,9 @@ class Pipeline(PipelineBase):
 
         # Break cycles in case there are, this is a noop if no cycle is found.
         # This will raise if a cycle can't be broken.
-        graph_without_cycles, components_in_cycles = self._break_supported_cycles_in_graph()
+        run_order, components_in_cycles = self._get_run_order()
 
-        run_queue: List[Tuple[str, Component]] = []
-        for node in nx.topological_sort(graph_without_cycles):
-            run_queue.append((node, self.graph.nodes[node]["instance"]))
+        run_queue: Deque[Tuple[str, Component]] = deque(run_order)
 
         # Set defaults inputs for those sockets that don't receive input neither from the user
         # nor from other Components.
@@ -424,7 +428,7 @@ class Pipeline(PipelineBase):
             extra_outputs: Dict[Any, Any] = {}
 
             while len(run_queue) > 0:
-                name, comp = run_queue.pop(0)
+                name, comp = run_queue.popleft()
 
                 if _is_lazy_variadic(comp) and not all(_is_lazy_variadic(comp) for _, comp in run_queue):
                     # We run Components with lazy variadic inputs only if there only Components with
@@ -447,7 +451,7 @@ class Pipeline(PipelineBase):
                     # After a cycle is run the previous run_queue can't be correct anymore cause it's
                     # not modified when running the subgraph.
                     # So we reset it given the output returned by the subgraph.
-                    run_queue = []
+                    run_queue = deque()
 
                     # Reset the waiting for input previous states, we managed to run at least one component
                     before_last_waiting_queue = None
@@ -473,18 +477,19 @@ class Pipeline(PipelineBase):
                     res: Dict[str, Any] = self._run_component(name, components_inputs[name], parent_span=span)
 
                     # Delete the inputs that were consumed by the Component and are not received from the user
+                    input_sockets = self.graph.nodes[name]["input_sockets"]
                     sockets = list(components_inputs[name].keys())
                     for socket_name in sockets:
-                        senders = comp.__haystack_input__._sockets_dict[socket_name].senders
+                        senders = input_sockets[socket_name].senders
                         if senders:
                             # Delete all inputs that are received from other Components
                             del components_inputs[name][socket_name]
                         # We keep inputs that came from the user
 
                     if name in include_outputs_from:
-                        # Deepcopy the outputs to prevent downstream nodes from modifying them
+                        # Deepcopy the outputs sent to other Components to prevent downstream nodes from modifying them
                         # We don't care about loops - Always store the last output.
-                        extra_outputs[name] = deepcopy(res)
+                        extra_outputs[name] = _copy_outputs_sent_to_receivers(comp, res)
 
                     # Reset the waiting for input previous states, we managed to run a component
                     before_last_waiting_queue = None
@@ -528,7 +533,8 @@ class Pipeline(PipelineBase):
                         _enqueue_component((name, comp), run_queue, waiting_queue)
                         continue
 
-                    before_last_waiting_queue = last_waiting_queue.copy() if last_waiting_queue is not None else None
+                    # The previous snapshot is never modified, a new set is built for each one
+                    before_last_waiting_queue = last_waiting_queue
                     last_waiting_queue = {item[0] for item in waiting_queue}
 
                     (name, comp) = self._find_next_runnable_component(components_inputs, waiting_queue)
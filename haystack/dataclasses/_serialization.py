@@ -0,0 +1,33 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+
+from collections import defaultdict
+from copy import deepcopy
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+
+def value_to_dict(value: Any) -> Any:
+    """
+    Copies a value converting the dataclasses it contains to dictionaries, the same way `dataclasses.asdict` does.
+
+    Used to serialize free-form fields like `meta` without paying for `asdict` on the whole object.
+
+    :param value: The value to copy.
+    :returns: A deep copy of the value where every nested dataclass instance is replaced by a dictionary.
+    """
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        # namedtuples are built from positional arguments, not from an iterable
+        return type(value)(*[value_to_dict(item) for item in value])
+    if isinstance(value, (list, tuple)):
+        return type(value)(value_to_dict(item) for item in value)
+    if isinstance(value, defaultdict):
+        return type(value)(
+            value.default_factory, {value_to_dict(key): value_to_dict(item) for key, item in value.items()}
+        )
+    if isinstance(value, dict):
+        return type(value)((value_to_dict(key), value_to_dict(item)) for key, item in value.items())
+    return deepcopy(value)
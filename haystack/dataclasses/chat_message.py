@@ -3,10 +3,16 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import warnings
-from dataclasses import asdict, dataclass, field
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, Optional
 
+from haystack.dataclasses._serialization import value_to_dict
+
+# Types whose values can be shared between a message and its deep copy
+_IMMUTABLE_META_TYPES = (str, int, float, bool, type(None))
+
 
 class ChatRole(str, Enum):
     """Enumeration representing the roles within a chat."""
@@ -53,6 +59,17 @@ class ChatMessage:
             warnings.warn(msg, DeprecationWarning)
         return object.__getattribute__(self, name)
 
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ChatMessage":
+        copied = copy(self)
+        # Registered before copying meta, in case meta refers back to this message
+        memo[id(self)] = copied
+        # Most meta dicts only hold scalars, so a shallow copy is enough and much cheaper than a full deepcopy
+        if all(type(value) in _IMMUTABLE_META_TYPES for value in self.meta.values()):
+            copied.meta = dict(self.meta)
+        else:
+            copied.meta = deepcopy(self.meta, memo)
+        return copied
+
     def is_from(self, role: ChatRole) -> bool:
         """
         Check if the message is from a specific role.
@@ -111,10 +128,7 @@ class ChatMessage:
         :returns:
             Serialized version of the object.
         """
-        data = asdict(self)
-        data["role"] = self.role.value
-
-        return data
+        return {"content": self.text, "role": self.role.value, "name": self.name, "meta": value_to_dict(self.meta)}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ChatMessage":
@@ -4,18 +4,23 @@
 
 import hashlib
 import io
-from dataclasses import asdict, dataclass, field, fields
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from numpy import ndarray
 from pandas import DataFrame, read_json
 
 from haystack import logging
+from haystack.dataclasses._serialization import value_to_dict
 from haystack.dataclasses.byte_stream import ByteStream
 from haystack.dataclasses.sparse_embedding import SparseEmbedding
 
 logger = logging.getLogger(__name__)
 
+# Fields of Haystack 1.x Documents that are accepted but not used anymore
+_LEGACY_FIELDS = ("content_type", "id_hash_keys")
+
 
 class _BackwardCompatible(type):
     """
@@ -137,11 +142,23 @@ class Document(metaclass=_BackwardCompatible):
         :param flatten:
             Whether to flatten `meta` field or not. Defaults to `True` to be backward-compatible with Haystack 1.x.
         """
-        data = asdict(self)
-        if (dataframe := data.get("dataframe")) is not None:
-            data["dataframe"] = dataframe.to_json()
-        if (blob := data.get("blob")) is not None:
-            data["blob"] = {"data": list(blob["data"]), "mime_type": blob["mime_type"]}
+        # Fields are copied one by one: `asdict` would deep copy `dataframe` and `blob` only to convert them afterwards
+        data: Dict[str, Any] = {}
+        for document_field in fields(self):
+            name = document_field.name
+            value = getattr(self, name)
+            if value is None:
+                data[name] = None
+            elif name == "dataframe":
+                data[name] = value.to_json()
+            elif name == "blob":
+                data[name] = {"data": list(value.data), "mime_type": value.mime_type}
+            elif name == "embedding":
+                data[name] = list(value)
+            elif name == "sparse_embedding":
+                data[name] = value.to_dict()
+            else:
+                data[name] = value_to_dict(value)
 
         if flatten:
             meta = data.pop("meta")
@@ -149,6 +166,16 @@ class Document(metaclass=_BackwardCompatible):
 
         return data
 
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _document_fields(cls) -> FrozenSet[str]:
+        """
+        Returns the names of the fields of this Document class, including the legacy ones.
+
+        The names are computed once per class, subclasses adding fields get their own set.
+        """
+        return frozenset((*_LEGACY_FIELDS, *(f.name for f in fields(cls))))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Document":
         """
@@ -171,8 +198,7 @@ class Document(metaclass=_BackwardCompatible):
         # a document field is a metadata key. We treat legacy fields as document fields
         # for backward compatibility.
         flatten_meta = {}
-        legacy_fields = ["content_type", "id_hash_keys"]
-        document_fields = legacy_fields + [f.name for f in fields(cls)]
+        document_fields = cls._document_fields()
         for key in list(data.keys()):
             if key not in document_fields:
                 flatten_meta[key] = data.pop(key)
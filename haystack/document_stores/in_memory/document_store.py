@@ -9,7 +9,7 @@ import uuid
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
 
 import numpy as np
 
@@ -46,11 +46,51 @@ class BM25DocumentStats:
     doc_len: int
 
 
+@dataclass
+class _EmbeddingMatrix:
+    """
+    A dataclass holding the embeddings of the stored Documents as a single contiguous matrix.
+
+    :param documents: The Documents that have an embedding, in the same order as the matrix rows.
+    :param sources: The embedding lists the matrix was built from, used to detect Documents modified in place.
+    :param embeddings: A 2D array of shape (number of documents, embedding size) with the Documents' embeddings,
+        or `None` if the embeddings have different sizes and no single matrix can be built.
+    :param rows: The row of each Document in the matrix, indexed by Document ID.
+    :param norms: The L2 norms of the embeddings, computed on the first query using cosine similarity.
+    """
+
+    documents: List[Document]
+    sources: List[Optional[List[float]]]
+    embeddings: Optional[np.ndarray]
+    rows: Dict[str, int]
+    norms: Optional[np.ndarray] = None
+
+    def is_valid_for(self, documents: List[Document]) -> bool:
+        """
+        Checks whether the matrix still matches the given Documents and their embeddings.
+
+        :param documents: The stored Documents that have an embedding.
+        :returns: `True` if the Documents and their embedding lists are the same objects the matrix was built from.
+        """
+        return len(documents) == len(self.documents) and all(
+            doc is cached_doc and doc.embedding is source
+            for doc, cached_doc, source in zip(documents, self.documents, self.sources)
+        )
+
+
 # Global storage for all InMemoryDocumentStore instances, indexed by the index name.
 _STORAGES: Dict[str, Dict[str, Document]] = {}
 _BM25_STATS_STORAGES: Dict[str, Dict[str, BM25DocumentStats]] = {}
 _AVERAGE_DOC_LEN_STORAGES: Dict[str, float] = {}
 _FREQ_VOCAB_FOR_IDF_STORAGES: Dict[str, Counter] = {}
+# Built lazily at retrieval time, dropped whenever documents are written or deleted and rebuilt if stored Documents
+# get a new embedding.
+_EMBEDDING_MATRIX_STORAGES: Dict[str, _EmbeddingMatrix] = {}
+
+_DIFFERENT_EMBEDDING_SIZES_MESSAGE = (
+    "The embedding size of all Documents should be the same. "
+    "Please make sure that the Documents have been embedded with the same model."
+)
 
 
 class InMemoryDocumentStore:
@@ -418,6 +458,8 @@ class InMemoryDocumentStore:
         if policy == DuplicatePolicy.NONE:
             policy = DuplicatePolicy.FAIL
 
+        _EMBEDDING_MATRIX_STORAGES.pop(self.index, None)
+
         written_documents = len(documents)
         for document in documents:
             if policy != DuplicatePolicy.OVERWRITE and document.id in self.storage.keys():
@@ -465,6 +507,8 @@ class InMemoryDocumentStore:
 
         :param document_ids: The object_ids to delete.
         """
+        _EMBEDDING_MATRIX_STORAGES.pop(self.index, None)
+
         for doc_id in document_ids:
             if doc_id not in self.storage.keys():
                 continue
@@ -525,12 +569,14 @@ class InMemoryDocumentStore:
         # see https://github.com/deepset-ai/haystack/pull/6889 for more context.
         negatives_are_valid = self.bm25_algorithm == "BM25Okapi" and not scale_score
 
+        if scale_score and results:
+            # Scale all the top_k scores with a single vectorized call
+            scaled_scores = expit(np.array([score for _, score in results]) / BM25_SCALING_FACTOR).tolist()
+            results = [(doc, scaled_score) for (doc, _), scaled_score in zip(results, scaled_scores)]
+
         # Create documents with the BM25 score to return them
         return_documents = []
         for doc, score in results:
-            if scale_score:
-                score = expit(score / BM25_SCALING_FACTOR)
-
             if not negatives_are_valid and score <= 0.0:
                 continue
 
@@ -543,7 +589,7 @@ class InMemoryDocumentStore:
 
     def embedding_retrieval(  # pylint: disable=too-many-positional-arguments
         self,
-        query_embedding: List[float],
+        query_embedding: Union[List[float], np.ndarray],
         filters: Optional[Dict[str, Any]] = None,
         top_k: int = 10,
         scale_score: bool = False,
@@ -552,47 +598,189 @@ class InMemoryDocumentStore:
         """
         Retrieves documents that are most similar to the query embedding using a vector similarity metric.
 
-        :param query_embedding: Embedding of the query.
+        :param query_embedding: Embedding of the query, as a list of floats or a 1D NumPy array.
         :param filters: A dictionary with filters to narrow down the search space.
         :param top_k: The number of top documents to retrieve. Default is 10.
         :param scale_score: Whether to scale the scores of the retrieved Documents. Default is False.
         :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
         :returns: A list of the top_k documents most relevant to the query.
         """
-        if len(query_embedding) == 0 or not isinstance(query_embedding[0], float):
+        # convert the query embedding only once, NumPy arrays of floats are used as they are
+        query_embedding = np.asarray(query_embedding)
+        if (
+            query_embedding.ndim != 1
+            or query_embedding.size == 0
+            or not np.issubdtype(query_embedding.dtype, np.floating)
+        ):
             raise ValueError("query_embedding should be a non-empty list of floats.")
 
-        filters = filters or {}
-        all_documents = self.filter_documents(filters=filters)
+        if filters:
+            all_documents = self.filter_documents(filters=filters)
+            documents_with_embeddings = [doc for doc in all_documents if doc.embedding is not None]
+            num_documents = len(all_documents)
+            document_embeddings = None
+            document_norms = None
+        else:
+            # without filters, all the Documents are scored against the cached embedding matrix
+            embedding_matrix = self._get_embedding_matrix()
+            if embedding_matrix.embeddings is None:
+                raise DocumentStoreError(_DIFFERENT_EMBEDDING_SIZES_MESSAGE)
+            documents_with_embeddings = embedding_matrix.documents
+            num_documents = self.count_documents()
+            document_embeddings = embedding_matrix.embeddings
+            document_norms = self._get_embedding_norms(embedding_matrix)
 
-        documents_with_embeddings = [doc for doc in all_documents if doc.embedding is not None]
         if len(documents_with_embeddings) == 0:
             logger.warning(
                 "No Documents found with embeddings. Returning empty list. "
                 "To generate embeddings, use a DocumentEmbedder."
             )
             return []
-        elif len(documents_with_embeddings) < len(all_documents):
+        elif len(documents_with_embeddings) < num_documents:
             logger.info(
                 "Skipping some Documents that don't have an embedding. "
                 "To generate embeddings, use a DocumentEmbedder."
             )
 
-        scores = self._compute_query_embedding_similarity_scores(
-            embedding=query_embedding, documents=documents_with_embeddings, scale_score=scale_score
+        if document_embeddings is None:
+            document_embeddings, document_norms = self._gather_embeddings(documents_with_embeddings)
+        scores = self._compute_similarity_scores(
+            query_embedding=query_embedding,
+            document_embeddings=document_embeddings,
+            scale_score=scale_score,
+            document_norms=document_norms,
         )
 
         # create Documents with the similarity score for the top k results
         top_documents = []
-        for doc, score in sorted(zip(documents_with_embeddings, scores), key=lambda x: x[1], reverse=True)[:top_k]:
-            doc_fields = doc.to_dict()
-            doc_fields["score"] = score
+        for idx in self._top_k_indices(scores=scores, top_k=top_k):
+            doc_fields = documents_with_embeddings[idx].to_dict()
+            doc_fields["score"] = scores[idx].item()
             if return_embedding is False:
                 doc_fields["embedding"] = None
             top_documents.append(Document.from_dict(doc_fields))
 
         return top_documents
 
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, top_k: int) -> List[int]:
+        """
+        Returns the indices of the `top_k` highest scores, sorted by descending score.
+
+        Selects the candidates in linear time instead of sorting all the scores.
+        Equal scores keep their original order, as with a stable sort.
+
+        :param scores: A 1D array of scores.
+        :param top_k: The number of indices to return.
+        :returns: A list of indices into `scores`.
+        """
+        if 0 < top_k < len(scores):
+            # all the scores at least as high as the k-th highest one, in their original order
+            kth_score = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+            candidates = np.flatnonzero(scores >= kth_score)
+        else:
+            candidates = np.arange(len(scores))
+        order = np.argsort(-scores[candidates], kind="stable")
+        return candidates[order][:top_k].tolist()
+
+    def _get_embedding_matrix(self) -> _EmbeddingMatrix:
+        """
+        Returns the embeddings of all the stored Documents as a single matrix, building it if needed.
+
+        The matrix is cached per index and rebuilt when the stored Documents or their embedding lists are replaced.
+        Changing the values of an embedding list in place is not detected.
+        If the embeddings have different sizes, the failure is cached too.
+
+        :returns: The _EmbeddingMatrix of the Documents that have an embedding.
+        """
+        documents = [doc for doc in self.storage.values() if doc.embedding is not None]
+        cached_matrix = _EMBEDDING_MATRIX_STORAGES.get(self.index)
+        if cached_matrix is not None and cached_matrix.is_valid_for(documents):
+            return cached_matrix
+
+        embeddings: Optional[np.ndarray]
+        try:
+            embeddings = self._build_embedding_matrix(documents)
+        except DocumentStoreError:
+            # Remember the failure so that filtered queries don't convert all the embeddings again
+            embeddings = None
+        embedding_matrix = _EmbeddingMatrix(
+            documents=documents,
+            sources=[doc.embedding for doc in documents],
+            embeddings=embeddings,
+            rows={doc.id: row for row, doc in enumerate(documents)},
+        )
+        _EMBEDDING_MATRIX_STORAGES[self.index] = embedding_matrix
+        return embedding_matrix
+
+    def _get_embedding_norms(self, embedding_matrix: _EmbeddingMatrix) -> Optional[np.ndarray]:
+        """
+        Returns the L2 norms of the embedding matrix rows if the similarity function needs them.
+
+        The norms are computed on first use and cached together with the matrix.
+
+        :param embedding_matrix: The _EmbeddingMatrix of the stored Documents.
+        :returns: The norms of the rows when using cosine similarity, `None` otherwise.
+        """
+        if self.embedding_similarity_function != "cosine" or embedding_matrix.embeddings is None:
+            return None
+        if embedding_matrix.norms is None:
+            embedding_matrix.norms = self._row_norms(embedding_matrix.embeddings)
+        return embedding_matrix.norms
+
+    def _gather_embeddings(self, documents: List[Document]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Returns the embeddings and norms of a subset of the stored Documents, like the ones matching some filters.
+
+        The rows are gathered from the cached embedding matrix with a single indexing operation instead of
+        converting the embeddings of each Document again.
+
+        :param documents: A list of stored Documents with embeddings.
+        :returns: A 2D array with one row per Document and, when using cosine similarity, the norms of the rows.
+        """
+        embedding_matrix = self._get_embedding_matrix()
+        if embedding_matrix.embeddings is None:
+            # The stored Documents have different embedding sizes, but the filtered ones might still match
+            return self._build_embedding_matrix(documents), None
+
+        if any(doc.id not in embedding_matrix.rows for doc in documents):
+            # Some Documents got their embedding after the matrix was cached, so they have no row in it
+            return self._build_embedding_matrix(documents), None
+
+        rows = np.array([embedding_matrix.rows[doc.id] for doc in documents], dtype=np.intp)
+        document_norms = self._get_embedding_norms(embedding_matrix)
+        return (embedding_matrix.embeddings[rows], document_norms[rows] if document_norms is not None else None)
+
+    @staticmethod
+    def _build_embedding_matrix(documents: List[Document]) -> np.ndarray:
+        """
+        Stacks the embeddings of the given Documents into a 2D array.
+
+        :param documents: A list of Documents with embeddings.
+        :returns: A 2D array with one row per Document.
+        """
+        try:
+            document_embeddings = np.array([doc.embedding for doc in documents], dtype=np.float64)
+        except ValueError as e:
+            if "inhomogeneous shape" in str(e):
+                raise DocumentStoreError(_DIFFERENT_EMBEDDING_SIZES_MESSAGE) from e
+            raise e
+        if document_embeddings.ndim == 1:
+            document_embeddings = np.expand_dims(a=document_embeddings, axis=0)
+        return document_embeddings
+
+    @staticmethod
+    def _row_norms(embeddings: np.ndarray) -> np.ndarray:
+        """
+        Computes the L2 norm of each row of a 2D array.
+
+        `einsum` sums the squares in a single pass, without the temporary array `np.linalg.norm` allocates.
+
+        :param embeddings: A 2D array with one embedding per row.
+        :returns: A 1D array with the norm of each row.
+        """
+        return np.sqrt(np.einsum("ij,ij->i", embeddings, embeddings))
+
     def _compute_query_embedding_similarity_scores(
         self, embedding: List[float], documents: List[Document], scale_score: bool = False
     ) -> List[float]:
@@ -604,30 +792,34 @@ class InMemoryDocumentStore:
         :param scale_score: Whether to scale the scores of the Documents. Default is False.
         :returns: A list of scores.
         """
+        return self._compute_similarity_scores(
+            query_embedding=embedding,
+            document_embeddings=self._build_embedding_matrix(documents),
+            scale_score=scale_score,
+        ).tolist()
 
-        query_embedding = np.array(embedding)
-        if query_embedding.ndim == 1:
-            query_embedding = np.expand_dims(a=query_embedding, axis=0)
-
-        try:
-            document_embeddings = np.array([doc.embedding for doc in documents])
-        except ValueError as e:
-            if "inhomogeneous shape" in str(e):
-                raise DocumentStoreError(
-                    "The embedding size of all Documents should be the same. "
-                    "Please make sure that the Documents have been embedded with the same model."
-                ) from e
-            raise e
-        if document_embeddings.ndim == 1:
-            document_embeddings = np.expand_dims(a=document_embeddings, axis=0)
+    def _compute_similarity_scores(
+        self,
+        query_embedding: Union[List[float], np.ndarray],
+        document_embeddings: np.ndarray,
+        scale_score: bool = False,
+        document_norms: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Computes the similarity scores between the query embedding and a matrix of document embeddings.
 
-        if self.embedding_similarity_function == "cosine":
-            # cosine similarity is a normed dot product
-            query_embedding /= np.linalg.norm(x=query_embedding, axis=1, keepdims=True)
-            document_embeddings /= np.linalg.norm(x=document_embeddings, axis=1, keepdims=True)
+        :param query_embedding: Embedding of the query.
+        :param document_embeddings: A 2D array with one document embedding per row. It's never modified.
+        :param scale_score: Whether to scale the scores of the Documents. Default is False.
+        :param document_norms: Precomputed L2 norms of the rows of `document_embeddings`.
+            Only used for cosine similarity. If not provided, they're computed on the fly.
+        :returns: An array of scores, one per row of `document_embeddings`.
+        """
+        query = np.asarray(query_embedding, dtype=np.float64)
 
         try:
-            scores = np.dot(a=query_embedding, b=document_embeddings.T)[0].tolist()
+            # a single matrix-vector product scores all the Documents at once
+            scores = np.dot(a=document_embeddings, b=query)
         except ValueError as e:
             if "shapes" in str(e) and "not aligned" in str(e):
                 raise DocumentStoreError(
@@ -636,10 +828,16 @@ class InMemoryDocumentStore:
                 ) from e
             raise e
 
+        if self.embedding_similarity_function == "cosine":
+            # cosine similarity is the dot product divided by the norms of both vectors
+            if document_norms is None:
+                document_norms = self._row_norms(document_embeddings)
+            scores = scores / (document_norms * np.linalg.norm(x=query))
+
         if scale_score:
             if self.embedding_similarity_function == "dot_product":
-                scores = [expit(float(score / DOT_PRODUCT_SCALING_FACTOR)) for score in scores]
+                scores = expit(scores / DOT_PRODUCT_SCALING_FACTOR)
             elif self.embedding_similarity_function == "cosine":
-                scores = [(score + 1) / 2 for score in scores]
+                scores = (scores + 1) / 2
 
         return scores
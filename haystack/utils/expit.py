@@ -2,13 +2,30 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
-from numpy import exp
+import math
+from typing import overload
 
+from numpy import exp, ndarray
 
-def expit(x) -> float:
+
+@overload
+def expit(x: float) -> float: ...
+
+
+@overload
+def expit(x: ndarray) -> ndarray: ...
+
+
+def expit(x):
     """
     Compute logistic sigmoid function. Maps input values to a range between 0 and 1
 
     :param x: input value. Can be a scalar or a numpy array.
     """
+    if isinstance(x, (int, float)):
+        # Plain Python scalars skip the NumPy dispatch, the formula is picked so that `math.exp` can't overflow
+        if x >= 0:
+            return 1 / (1 + math.exp(-x))
+        exp_x = math.exp(x)
+        return exp_x / (1 + exp_x)
     return 1 / (1 + exp(-x))
@@ -180,6 +180,42 @@ class TestContextRelevanceEvaluator:
             "individual_scores": [1, 0],
         }
 
+    def test_run_evaluates_duplicated_inputs_once(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator()
+        prompts = []
+
+        def generator_run(self, *args, **kwargs):
+            prompts.append(kwargs["prompt"])
+            if "Football" in kwargs["prompt"]:
+                return {"replies": ['{"relevant_statements": ["a", "b"], "score": 1}']}
+            else:
+                return {"replies": ['{"relevant_statements": [], "score": 0}']}
+
+        monkeypatch.setattr("haystack.components.generators.openai.OpenAIGenerator.run", generator_run)
+
+        questions = [
+            "Which is the most popular global sport?",
+            "Who created Python?",
+            "Which is the most popular global sport?",
+        ]
+        contexts = [
+            ["Football is the most popular sport."],
+            ["Python is a language."],
+            ["Football is the most popular sport."],
+        ]
+        results = component.run(questions=questions, contexts=contexts)
+
+        assert len(prompts) == 2
+        assert results["results"] == [
+            {"score": 1, "relevant_statements": ["a", "b"]},
+            {"score": 0, "relevant_statements": []},
+            {"score": 1, "relevant_statements": ["a", "b"]},
+        ]
+        assert results["results"][0] is not results["results"][2]
+        assert results["individual_scores"] == [1, 0, 1]
+        assert results["score"] == pytest.approx(2 / 3)
+
     def test_run_missing_parameters(self, monkeypatch):
         monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
         component = ContextRelevanceEvaluator()
@@ -219,6 +255,35 @@ class TestContextRelevanceEvaluator:
         assert results["results"][1]["relevant_statements"] == []
         assert math.isnan(results["results"][1]["score"])
 
+    def test_run_warns_about_failures_of_duplicated_inputs(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator(raise_on_failure=False)
+
+        def generator_run(self, *args, **kwargs):
+            if "Python" in kwargs["prompt"]:
+                raise Exception("OpenAI API request failed.")
+            return {"replies": ['{"relevant_statements": ["c", "d"], "score": 1}']}
+
+        monkeypatch.setattr("haystack.components.generators.openai.OpenAIGenerator.run", generator_run)
+
+        questions = ["Who created Python?", "Which is the most popular global sport?", "Who created Python?"]
+        contexts = [["Python is a language."], ["Football is the most popular sport."], ["Python is a language."]]
+        with pytest.warns(UserWarning, match="LLM evaluator failed for 2 out of 3 inputs."):
+            results = component.run(questions=questions, contexts=contexts)
+
+        assert math.isnan(results["individual_scores"][0])
+        assert results["individual_scores"][1] == 1
+        assert math.isnan(results["individual_scores"][2])
+
+    def test_run_with_empty_inputs(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
+        component = ContextRelevanceEvaluator()
+        results = component.run(questions=[], contexts=[])
+
+        assert results["results"] == []
+        assert results["individual_scores"] == []
+        assert math.isnan(results["score"])
+
     @pytest.mark.skipif(
         not os.environ.get("OPENAI_API_KEY", None),
         reason="Export an env var called OPENAI_API_KEY containing the OpenAI API key to run this test.",
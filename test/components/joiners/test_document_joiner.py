@@ -141,6 +141,13 @@ class TestDocumentJoiner:
             output["documents"], key=lambda d: d.id
         )
 
+    def test_run_with_concatenate_join_mode_keeps_best_scored_duplicate(self):
+        joiner = DocumentJoiner(sort_by_score=False)
+        documents_1 = [Document(content="a", score=0.2), Document(content="b", score=0.5)]
+        documents_2 = [Document(content="b", score=0.1), Document(content="a", score=0.9), Document(content="a")]
+        output = joiner.run([documents_1, documents_2])
+        assert [(doc.content, doc.score) for doc in output["documents"]] == [("a", 0.9), ("b", 0.5)]
+
     def test_run_with_merge_join_mode(self):
         joiner = DocumentJoiner(join_mode="merge", weights=[1.5, 0.5])
         documents_1 = [Document(content="a", score=1.0), Document(content="b", score=2.0)]
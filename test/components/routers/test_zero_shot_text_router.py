@@ -1,12 +1,23 @@
 # SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
-from haystack.components.routers.zero_shot_text_router import TransformersZeroShotTextRouter
-from haystack.utils import ComponentDevice, Secret
+from haystack.components.routers.zero_shot_text_router import TransformersZeroShotTextRouter, _ZeroShotPipelineFactory
+from haystack.utils import ComponentDevice, Secret, serialize_callable
+
+
+@pytest.fixture(autouse=True)
+def clear_pipeline_factory():
+    _ZeroShotPipelineFactory._instances.clear()
+    yield
+    _ZeroShotPipelineFactory._instances.clear()
+
+
+def short_text_fast_path(text: str):
+    return "query" if len(text.split()) <= 4 else None
 
 
 class TestTransformersZeroShotTextRouter:
@@ -23,9 +34,21 @@ class TestTransformersZeroShotTextRouter:
                     "device": ComponentDevice.resolve_device(None).to_hf(),
                     "task": "zero-shot-classification",
                 },
+                "fast_path": None,
+                "prediction_cache_size": 1024,
             },
         }
 
+    def test_to_dict_with_fast_path(self):
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"], fast_path=short_text_fast_path)
+        router_dict = router.to_dict()
+        assert router_dict["init_parameters"]["fast_path"] == serialize_callable(short_text_fast_path)
+
+    def test_from_dict_with_fast_path(self):
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"], fast_path=short_text_fast_path)
+        new_router = TransformersZeroShotTextRouter.from_dict(router.to_dict())
+        assert new_router.fast_path is short_text_fast_path
+
     def test_from_dict(self, monkeypatch):
         monkeypatch.delenv("HF_API_TOKEN", raising=False)
         data = {
@@ -63,6 +86,7 @@ class TestTransformersZeroShotTextRouter:
         component = TransformersZeroShotTextRouter.from_dict(data)
         assert component.labels == ["query", "passage"]
         assert component.pipeline is None
+        assert component.prediction_cache_size == 1024
         assert component.token == Secret.from_dict(
             {"env_vars": ["HF_API_TOKEN", "HF_TOKEN"], "strict": False, "type": "env_var"}
         )
@@ -79,6 +103,37 @@ class TestTransformersZeroShotTextRouter:
         router.warm_up()
         assert router.pipeline is not None
 
+    @patch("haystack.components.routers.zero_shot_text_router.pipeline")
+    def test_warm_up_shares_pipeline(self, hf_pipeline_mock):
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"])
+        other_router = TransformersZeroShotTextRouter(labels=["positive", "negative"])
+        different_router = TransformersZeroShotTextRouter(labels=["query", "passage"], model="some-other-model")
+        hf_pipeline_mock.side_effect = lambda **kwargs: Mock()
+
+        router.warm_up()
+        other_router.warm_up()
+        different_router.warm_up()
+
+        assert router.pipeline is other_router.pipeline
+        assert router.pipeline is not different_router.pipeline
+        assert hf_pipeline_mock.call_count == 2
+
+    @patch("haystack.components.routers.zero_shot_text_router.pipeline")
+    def test_warm_up_does_not_share_pipeline_with_unserializable_kwargs(self, hf_pipeline_mock):
+        router = TransformersZeroShotTextRouter(
+            labels=["query", "passage"], huggingface_pipeline_kwargs={"config": Mock()}
+        )
+        other_router = TransformersZeroShotTextRouter(labels=["query", "passage"])
+        hf_pipeline_mock.side_effect = lambda **kwargs: Mock()
+
+        router.warm_up()
+        other_router.warm_up()
+
+        assert router.pipeline is not other_router.pipeline
+        assert _ZeroShotPipelineFactory._instances == {
+            _ZeroShotPipelineFactory._get_pipeline_id(other_router.huggingface_pipeline_kwargs): other_router.pipeline
+        }
+
     def test_run_fails_without_warm_up(self):
         router = TransformersZeroShotTextRouter(labels=["query", "passage"])
         with pytest.raises(RuntimeError):
@@ -103,6 +158,61 @@ class TestTransformersZeroShotTextRouter:
         assert router.pipeline is not None
         assert out == {"query": "What is the color of the sky?"}
 
+    @patch("haystack.components.routers.zero_shot_text_router.pipeline")
+    def test_run_caches_predictions(self, hf_pipeline_mock):
+        hf_pipeline_mock.return_value = [
+            {"sequence": "What is the color of the sky?", "labels": ["query", "passage"], "scores": [0.9, 0.1]}
+        ]
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"])
+        router.pipeline = hf_pipeline_mock
+        assert router.run("What is the color of the sky?") == {"query": "What is the color of the sky?"}
+        assert router.run("What is the color of the sky?") == {"query": "What is the color of the sky?"}
+        assert hf_pipeline_mock.call_count == 1
+
+    @patch("haystack.components.routers.zero_shot_text_router.pipeline")
+    def test_run_evicts_oldest_cached_prediction(self, hf_pipeline_mock):
+        hf_pipeline_mock.return_value = [{"sequence": "text", "labels": ["query", "passage"], "scores": [0.9, 0.1]}]
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"], prediction_cache_size=1)
+        router.pipeline = hf_pipeline_mock
+        router.run("first text")
+        router.run("second text")
+        router.run("first text")
+        assert hf_pipeline_mock.call_count == 3
+
+    @patch("haystack.components.routers.zero_shot_text_router.pipeline")
+    def test_run_without_prediction_cache(self, hf_pipeline_mock):
+        hf_pipeline_mock.return_value = [{"sequence": "text", "labels": ["query", "passage"], "scores": [0.9, 0.1]}]
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"], prediction_cache_size=0)
+        router.pipeline = hf_pipeline_mock
+        router.run("text")
+        router.run("text")
+        assert hf_pipeline_mock.call_count == 2
+        assert len(router._prediction_cache) == 0
+
+    @patch("haystack.components.routers.zero_shot_text_router.pipeline")
+    def test_run_does_not_reuse_predictions_for_other_labels(self, hf_pipeline_mock):
+        hf_pipeline_mock.return_value = [{"sequence": "text", "labels": ["query", "passage"], "scores": [0.9, 0.1]}]
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"])
+        router.pipeline = hf_pipeline_mock
+        assert router.run("text") == {"query": "text"}
+
+        hf_pipeline_mock.return_value = [{"sequence": "text", "labels": ["question", "passage"], "scores": [0.9, 0.1]}]
+        router.labels = ["question", "passage"]
+        assert router.run("text") == {"question": "text"}
+        assert hf_pipeline_mock.call_count == 2
+
+    @patch("haystack.components.routers.zero_shot_text_router.pipeline")
+    def test_run_with_fast_path(self, hf_pipeline_mock):
+        hf_pipeline_mock.return_value = [{"sequence": "text", "labels": ["passage", "query"], "scores": [0.9, 0.1]}]
+        router = TransformersZeroShotTextRouter(labels=["query", "passage"], fast_path=short_text_fast_path)
+        router.pipeline = hf_pipeline_mock
+        assert router.run("Color of the sky?") == {"query": "Color of the sky?"}
+        assert hf_pipeline_mock.call_count == 0
+        assert router.run("The sky is blue because of Rayleigh scattering.") == {
+            "passage": "The sky is blue because of Rayleigh scattering."
+        }
+        assert hf_pipeline_mock.call_count == 1
+
     @pytest.mark.integration
     def test_run(self):
         router = TransformersZeroShotTextRouter(labels=["query", "passage"])
@@ -16,6 +16,7 @@ from haystack.core.errors import DeserializationError, PipelineConnectError, Pip
 from haystack.core.pipeline import Pipeline, PredefinedPipeline
 from haystack.core.pipeline.base import (
     _add_missing_input_defaults,
+    _copy_outputs_sent_to_receivers,
     _enqueue_component,
     _dequeue_component,
     _enqueue_waiting_component,
@@ -788,6 +789,29 @@ class TestPipeline:
         for node in pipe.graph.nodes:
             assert pipe.graph.nodes[node]["visits"] == 0
 
+    def test__get_run_order(self):
+        double = Double()
+        add_one = AddFixedValue(add=1)
+        add_two = AddFixedValue(add=2)
+        pipe = Pipeline()
+        pipe.add_component("add_one", add_one)
+        pipe.add_component("double", double)
+        pipe.connect("add_one", "double")
+
+        run_order, components_in_cycles = pipe._get_run_order()
+        assert run_order == [("add_one", add_one), ("double", double)]
+        assert components_in_cycles == {}
+        assert pipe._get_run_order() is pipe._get_run_order()
+
+        pipe.add_component("add_two", add_two)
+        pipe.connect("add_two.result", "add_one.value")
+        run_order, _ = pipe._get_run_order()
+        assert run_order == [("add_two", add_two), ("add_one", add_one), ("double", double)]
+
+        pipe.remove_component("add_two")
+        run_order, _ = pipe._get_run_order()
+        assert run_order == [("add_one", add_one), ("double", double)]
+
     def test__normalize_varidiac_input_data(self):
         pipe = Pipeline()
         template = """
@@ -1065,6 +1089,39 @@ class TestPipeline:
 
         assert caplog.messages == ["Running component document_builder"]
 
+    def test__run_component_without_tracing(self):
+        document_builder = component_class(
+            "DocumentBuilder", input_types={"text": str}, output={"doc": Document(content="some words")}
+        )()
+        pipe = Pipeline()
+        pipe.add_component("document_builder", document_builder)
+
+        with patch("haystack.core.pipeline.pipeline.tracing.tracer.trace") as trace_mock:
+            res = pipe._run_component("document_builder", {"text": "whatever"})
+
+        assert res == {"doc": Document(content="some words")}
+        assert pipe.graph.nodes["document_builder"]["visits"] == 1
+        trace_mock.assert_not_called()
+
+    def test__get_component_specs(self):
+        sentence_builder = component_class(
+            "SentenceBuilder", input_types={"words": List[str]}, output={"text": "some words"}
+        )()
+        document_builder = component_class("DocumentBuilder", input_types={"text": str}, output={"doc": None})()
+
+        pipe = Pipeline()
+        pipe.add_component("sentence_builder", sentence_builder)
+        pipe.add_component("document_builder", document_builder)
+
+        input_spec, output_spec = pipe._get_component_specs("sentence_builder")
+        assert output_spec == {"text": {"type": "str", "receivers": []}}
+        assert pipe._get_component_specs("sentence_builder") is pipe._get_component_specs("sentence_builder")
+
+        pipe.connect("sentence_builder.text", "document_builder.text")
+        input_spec, output_spec = pipe._get_component_specs("sentence_builder")
+        assert input_spec == {"words": {"type": "typing.List[str]", "senders": []}}
+        assert output_spec == {"text": {"type": "str", "receivers": ["document_builder"]}}
+
     def test__run_component_with_variadic_input(self):
         document_joiner = component_class("DocumentJoiner", input_types={"docs": Variadic[Document]})()
 
@@ -1309,6 +1366,23 @@ class TestPipeline:
         waiting_queue = [("document_builder", document_joiner), ("document_joiner", document_joiner)]
         assert not pipe._is_stuck_in_a_loop(waiting_queue)
 
+    def test__copy_outputs_sent_to_receivers(self):
+        document_builder = component_class(
+            "DocumentBuilder", input_types={"text": str}, output_types={"docs": List[Document], "meta": dict}
+        )()
+        document_cleaner = component_class("DocumentCleaner", input_types={"docs": List[Document]})()
+        pipe = Pipeline()
+        pipe.add_component("document_builder", document_builder)
+        pipe.add_component("document_cleaner", document_cleaner)
+        pipe.connect("document_builder.docs", "document_cleaner.docs")
+
+        outputs = {"docs": [Document(content="some text")], "meta": {"some": "meta"}}
+        copied_outputs = _copy_outputs_sent_to_receivers(document_builder, outputs)
+
+        assert copied_outputs == outputs
+        assert copied_outputs["docs"] is not outputs["docs"]
+        assert copied_outputs["meta"] is outputs["meta"]
+
     def test__enqueue_component(self):
         document_builder = component_class(
             "DocumentBuilder", input_types={"text": str}, output_types={"doc": Document}
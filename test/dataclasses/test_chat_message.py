@@ -1,10 +1,12 @@
 # SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+from copy import deepcopy
+
 import pytest
 from transformers import AutoTokenizer
 
-from haystack.dataclasses import ChatMessage, ChatRole
+from haystack.dataclasses import ChatMessage, ChatRole, SparseEmbedding
 from haystack.components.generators.openai_utils import _convert_message_to_openai_format
 
 
@@ -107,6 +109,45 @@ def test_to_dict():
     assert message.to_dict() == {"content": content, "role": role, "name": None, "meta": meta}
 
 
+def test_to_dict_copies_meta(recwarn):
+    message = ChatMessage.from_assistant("content", meta={"usage": {"prompt_tokens": 1}})
+
+    data = message.to_dict()
+    data["meta"]["usage"]["prompt_tokens"] = 2
+
+    assert message.meta == {"usage": {"prompt_tokens": 1}}
+    assert len(recwarn) == 0
+
+
+def test_to_dict_converts_dataclasses_in_meta():
+    message = ChatMessage.from_assistant("content", meta={"sparse": SparseEmbedding(indices=[0], values=[0.1])})
+    assert message.to_dict()["meta"] == {"sparse": {"indices": [0], "values": [0.1]}}
+
+
+def test_deepcopy(recwarn):
+    message = ChatMessage.from_assistant("content", meta={"model": "some-model", "index": 0})
+    nested_message = ChatMessage.from_assistant("content", meta={"usage": {"prompt_tokens": 1}})
+
+    copied, nested_copied = deepcopy([message, nested_message])
+    nested_copied.meta["usage"]["prompt_tokens"] = 2
+
+    assert (copied.text, copied.role, copied.name) == (message.text, message.role, message.name)
+    assert copied.meta == message.meta
+    assert copied.meta is not message.meta
+    assert nested_message.meta == {"usage": {"prompt_tokens": 1}}
+    assert len(recwarn) == 0
+
+
+def test_deepcopy_with_meta_referencing_message():
+    message = ChatMessage.from_assistant("content")
+    message.meta["message"] = message
+
+    copied = deepcopy(message)
+
+    assert copied is not message
+    assert copied.meta["message"] is copied
+
+
 def test_from_dict():
     assert ChatMessage.from_dict(data={"content": "text", "role": "user", "name": None}) == ChatMessage.from_user(
         "text"
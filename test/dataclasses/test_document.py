@@ -1,6 +1,10 @@
 # SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import List
+
 import pandas as pd
 import pytest
 
@@ -9,6 +13,11 @@ from haystack.dataclasses.byte_stream import ByteStream
 from haystack.dataclasses.sparse_embedding import SparseEmbedding
 
 
+@dataclass
+class TaggedDocument(Document):
+    tags: List[str] = field(default_factory=list)
+
+
 @pytest.mark.parametrize(
     "doc,doc_str",
     [
@@ -200,6 +209,41 @@ def test_to_dict_with_custom_parameters_without_flattening():
     }
 
 
+def test_to_dict_copies_mutable_fields():
+    doc = Document(meta={"nested": {"key": "value"}}, embedding=[1.0, 2.0])
+
+    data = doc.to_dict(flatten=False)
+    data["meta"]["nested"]["key"] = "other value"
+    data["embedding"].append(3.0)
+
+    assert doc.meta == {"nested": {"key": "value"}}
+    assert doc.embedding == [1.0, 2.0]
+
+
+def test_to_dict_converts_dataclasses_in_meta():
+    doc = Document(meta={"sparse": [SparseEmbedding(indices=[0], values=[0.1])]})
+    assert doc.to_dict()["sparse"] == [{"indices": [0], "values": [0.1]}]
+
+
+def test_to_dict_converts_dataclasses_in_meta_dict_subclass():
+    doc = Document(meta={"ordered": OrderedDict([("sparse", SparseEmbedding(indices=[0], values=[0.1]))])})
+    ordered = doc.to_dict()["ordered"]
+    assert isinstance(ordered, OrderedDict)
+    assert ordered == {"sparse": {"indices": [0], "values": [0.1]}}
+
+
+def test_to_dict_with_document_subclass():
+    doc = TaggedDocument(content="test text", meta={"key": "value"}, tags=["a", "b"])
+
+    data = doc.to_dict()
+    assert data["tags"] == ["a", "b"]
+    assert data["key"] == "value"
+
+    new_doc = TaggedDocument.from_dict(data)
+    assert isinstance(new_doc, TaggedDocument)
+    assert new_doc == doc
+
+
 def test_from_dict():
     assert Document.from_dict({}) == Document()
 
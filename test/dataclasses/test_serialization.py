@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from collections import OrderedDict, defaultdict, namedtuple
+
+from haystack.dataclasses._serialization import value_to_dict
+from haystack.dataclasses.sparse_embedding import SparseEmbedding
+
+
+def test_value_to_dict_converts_nested_dataclasses():
+    Pair = namedtuple("Pair", ["first", "second"])
+
+    class TaggedList(list):
+        pass
+
+    embedding = SparseEmbedding(indices=[0], values=[0.1])
+    converted_embedding = {"indices": [0], "values": [0.1]}
+    value = {
+        "plain": [embedding, (embedding,)],
+        "ordered": OrderedDict([("key", embedding)]),
+        "default": defaultdict(list, {"key": embedding}),
+        "pair": Pair(embedding, 1),
+        "tagged": TaggedList([embedding]),
+    }
+
+    converted = value_to_dict(value)
+
+    assert converted["plain"] == [converted_embedding, (converted_embedding,)]
+    assert type(converted["ordered"]) is OrderedDict
+    assert converted["ordered"] == {"key": converted_embedding}
+    assert type(converted["default"]) is defaultdict
+    assert converted["default"].default_factory is list
+    assert converted["default"] == {"key": converted_embedding}
+    assert converted["pair"] == Pair(converted_embedding, 1)
+    assert type(converted["tagged"]) is TaggedList
+    assert converted["tagged"] == [converted_embedding]
+
+
+def test_value_to_dict_copies_values():
+    value = {"nested": {"list": [1, 2]}}
+    converted = value_to_dict(value)
+    converted["nested"]["list"].append(3)
+    assert value == {"nested": {"list": [1, 2]}}
@@ -4,6 +4,7 @@
 import logging
 from unittest.mock import patch
 
+import numpy as np
 import pandas as pd
 import pytest
 import tempfile
@@ -11,7 +12,9 @@ import tempfile
 from haystack import Document
 from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumentError
 from haystack.document_stores.in_memory import InMemoryDocumentStore
+from haystack.document_stores.in_memory.document_store import BM25_SCALING_FACTOR
 from haystack.testing.document_store import DocumentStoreBaseTests
+from haystack.utils import expit
 
 
 class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
@@ -206,6 +209,22 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         results = document_store.bm25_retrieval(query="Python", top_k=1, scale_score=False)
         assert results[0].score != results1[0].score
 
+    def test_bm25_retrieval_scales_all_top_k_scores(self, document_store: InMemoryDocumentStore):
+        docs = [
+            Document(content="Python programming"),
+            Document(content="Python and Java programming"),
+            Document(content="Java programming"),
+        ]
+        document_store.write_documents(docs)
+
+        results = document_store.bm25_retrieval(query="Python programming", top_k=3, scale_score=False)
+        scaled_results = document_store.bm25_retrieval(query="Python programming", top_k=3, scale_score=True)
+
+        assert [doc.id for doc in scaled_results] == [doc.id for doc in results]
+        for doc, scaled_doc in zip(results, scaled_results):
+            assert isinstance(scaled_doc.score, float)
+            assert scaled_doc.score == pytest.approx(expit(doc.score / BM25_SCALING_FACTOR))
+
     def test_bm25_retrieval_with_non_scaled_BM25Okapi(self):
         # Highly repetitive documents make BM25Okapi return negative scores, which should not be filtered if the
         # scores are not scaled
@@ -288,12 +307,29 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         assert len(results) == 1
         assert results[0].content == "Haystack supports multiple languages"
 
+    def test_embedding_retrieval_with_numpy_query_embedding(self):
+        docstore = InMemoryDocumentStore(embedding_similarity_function="cosine")
+        docs = [
+            Document(content="Hello world", embedding=[0.1, 0.2, 0.3, 0.4]),
+            Document(content="Haystack supports multiple languages", embedding=[1.0, 1.0, 1.0, 1.0]),
+        ]
+        docstore.write_documents(docs)
+        results = docstore.embedding_retrieval(
+            query_embedding=np.array([0.1, 0.1, 0.1, 0.1], dtype=np.float32), top_k=1
+        )
+        assert len(results) == 1
+        assert results[0].content == "Haystack supports multiple languages"
+
     def test_embedding_retrieval_invalid_query(self):
         docstore = InMemoryDocumentStore()
         with pytest.raises(ValueError, match="query_embedding should be a non-empty list of floats"):
             docstore.embedding_retrieval(query_embedding=[])
         with pytest.raises(ValueError, match="query_embedding should be a non-empty list of floats"):
             docstore.embedding_retrieval(query_embedding=["invalid", "list", "of", "strings"])  # type: ignore
+        with pytest.raises(ValueError, match="query_embedding should be a non-empty list of floats"):
+            docstore.embedding_retrieval(query_embedding=[[0.1, 0.1]])  # type: ignore
+        with pytest.raises(ValueError, match="query_embedding should be a non-empty list of floats"):
+            docstore.embedding_retrieval(query_embedding=np.array([[0.1, 0.1]]))
 
     def test_embedding_retrieval_no_embeddings(self, caplog):
         caplog.set_level(logging.WARNING)
@@ -408,6 +444,120 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         )
         assert scores == [0.1, 0.4]
 
+    def test_embedding_retrieval_after_writing_and_deleting_documents(self):
+        index = "test_embedding_retrieval_after_writing_and_deleting_documents"
+        docstore = InMemoryDocumentStore(index=index)
+        other_docstore = InMemoryDocumentStore(index=index)
+        docstore.write_documents([Document(id="1", content="Hello world", embedding=[0.1, 0.2, 0.3, 0.4])])
+
+        results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1])
+        assert [doc.id for doc in results] == ["1"]
+
+        other_docstore.write_documents([Document(id="2", content="Haystack", embedding=[1.0, 1.0, 1.0, 1.0])])
+        results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1])
+        assert [doc.id for doc in results] == ["2", "1"]
+
+        other_docstore.delete_documents(["2"])
+        results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1])
+        assert [doc.id for doc in results] == ["1"]
+
+    def test_embedding_retrieval_with_filters_uses_cached_embeddings(self):
+        docstore = InMemoryDocumentStore(embedding_similarity_function="cosine")
+        docs = [
+            Document(content="Hello world", embedding=[0.1, 0.2, 0.3, 0.4], meta={"lang": "en"}),
+            Document(
+                content="Haystack supports multiple languages", embedding=[1.0, 1.0, 1.0, 1.0], meta={"lang": "en"}
+            ),
+            Document(content="Hallo Welt", embedding=[0.4, 0.3, 0.2, 0.1], meta={"lang": "de"}),
+        ]
+        docstore.write_documents(docs)
+        filters = {"field": "meta.lang", "operator": "==", "value": "en"}
+
+        unfiltered_results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1], top_k=3)
+        results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1, 0.1, 0.1], filters=filters, top_k=3)
+
+        assert [doc.id for doc in results] == [doc.id for doc in unfiltered_results if doc.meta["lang"] == "en"]
+        assert [doc.score for doc in results] == [doc.score for doc in unfiltered_results if doc.meta["lang"] == "en"]
+
+    def test_embedding_retrieval_with_filters_documents_different_embedding_sizes(self):
+        docstore = InMemoryDocumentStore()
+        docs = [
+            Document(content="Hello world", embedding=[0.1, 0.2, 0.3, 0.4], meta={"model": "large"}),
+            Document(content="Haystack supports multiple languages", embedding=[1.0, 1.0], meta={"model": "small"}),
+        ]
+        docstore.write_documents(docs)
+        filters = {"field": "meta.model", "operator": "==", "value": "small"}
+
+        results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1], filters=filters)
+        assert [doc.content for doc in results] == ["Haystack supports multiple languages"]
+
+    def test_embedding_retrieval_document_embedded_after_caching(self):
+        docstore = InMemoryDocumentStore()
+        doc_a = Document(content="a", embedding=[1.0, 0.0])
+        doc_b = Document(content="b")
+        docstore.write_documents([doc_a, doc_b])
+        docstore.embedding_retrieval(query_embedding=[1.0, 0.0])
+
+        docstore.storage[doc_b.id].embedding = [0.0, 1.0]
+        results = docstore.embedding_retrieval(query_embedding=[0.0, 1.0])
+
+        assert [doc.id for doc in results] == [doc_b.id, doc_a.id]
+        assert [doc.score for doc in results] == pytest.approx([1.0, 0.0])
+
+    def test_embedding_retrieval_with_filters_document_embedded_after_caching(self):
+        docstore = InMemoryDocumentStore()
+        doc_a = Document(content="a", embedding=[1.0, 0.0], meta={"name": "a"})
+        doc_b = Document(content="b", meta={"name": "b"})
+        docstore.write_documents([doc_a, doc_b])
+        docstore.embedding_retrieval(query_embedding=[1.0, 0.0])
+
+        docstore.storage[doc_b.id].embedding = [0.0, 1.0]
+        filters = {"field": "meta.name", "operator": "==", "value": "b"}
+        results = docstore.embedding_retrieval(query_embedding=[0.0, 1.0], filters=filters)
+
+        assert [doc.id for doc in results] == [doc_b.id]
+        assert results[0].score == pytest.approx(1.0)
+
+    def test_embedding_retrieval_with_filters_caches_different_embedding_sizes(self):
+        docstore = InMemoryDocumentStore()
+        docs = [
+            Document(content="Hello world", embedding=[0.1, 0.2, 0.3, 0.4], meta={"model": "large"}),
+            Document(content="Haystack supports multiple languages", embedding=[1.0, 1.0], meta={"model": "small"}),
+        ]
+        docstore.write_documents(docs)
+        filters = {"field": "meta.model", "operator": "==", "value": "small"}
+
+        with patch.object(
+            InMemoryDocumentStore, "_build_embedding_matrix", wraps=InMemoryDocumentStore._build_embedding_matrix
+        ) as build_mock:
+            docstore.embedding_retrieval(query_embedding=[0.1, 0.1], filters=filters)
+            # the matrix of all the Documents fails, then the filtered one is built
+            assert build_mock.call_count == 2
+            results = docstore.embedding_retrieval(query_embedding=[0.1, 0.1], filters=filters)
+            # the failure is cached, only the filtered matrix is built
+            assert build_mock.call_count == 3
+
+        assert [doc.content for doc in results] == ["Haystack supports multiple languages"]
+        with pytest.raises(DocumentStoreError, match="The embedding size of all Documents should be the same"):
+            docstore.embedding_retrieval(query_embedding=[0.1, 0.1])
+
+    def test_top_k_indices(self):
+        scores = np.array([0.1, 0.5, 0.3, 0.5, 0.2])
+        assert InMemoryDocumentStore._top_k_indices(scores=scores, top_k=1) == [1]
+        assert InMemoryDocumentStore._top_k_indices(scores=scores, top_k=3) == [1, 3, 2]
+        assert InMemoryDocumentStore._top_k_indices(scores=scores, top_k=10) == [1, 3, 2, 4, 0]
+        assert InMemoryDocumentStore._top_k_indices(scores=scores, top_k=0) == []
+
+    def test_embedding_retrieval_with_top_k_zero(self):
+        docstore = InMemoryDocumentStore()
+        docstore.write_documents([Document(content="Hello world", embedding=[0.1, 0.2])])
+        assert docstore.embedding_retrieval(query_embedding=[0.1, 0.2], top_k=0) == []
+
+    def test_row_norms(self):
+        embeddings = np.array([[3.0, 4.0], [0.0, 0.0], [1.0, 1.0]])
+        norms = InMemoryDocumentStore._row_norms(embeddings)
+        assert norms == pytest.approx(np.linalg.norm(embeddings, axis=1))
+
     def test_multiple_document_stores_using_same_index(self):
         index = "test_multiple_document_stores_using_same_index"
         document_store_1 = InMemoryDocumentStore(index=index)
@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: 2022-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+import numpy as np
+import pytest
+
+from haystack.utils.expit import expit
+
+
+def test_expit_with_scalar():
+    assert expit(0) == 0.5
+    assert expit(2.5) == pytest.approx(1 / (1 + np.exp(-2.5)))
+    assert expit(-2.5) == pytest.approx(1 / (1 + np.exp(2.5)))
+    assert isinstance(expit(np.float64(1.0)), float)
+
+
+def test_expit_with_large_scalar():
+    assert expit(1000.0) == 1.0
+    assert expit(-1000.0) == 0.0
+
+
+def test_expit_with_array():
+    values = np.array([-2.5, 0.0, 2.5])
+    assert expit(values) == pytest.approx(1 / (1 + np.exp(-values)))